@@ -9,11 +9,11 @@ __all__ = [
     "Scru128Id",
 ]
 
-import datetime
-import re
-import secrets
+import os
 import threading
+import time
 import typing
+import weakref
 
 
 # The maximum value of 48-bit timestamp field.
@@ -25,9 +25,18 @@ MAX_COUNTER_HI = 0xFF_FFFF
 # The maximum value of 24-bit counter_lo field.
 MAX_COUNTER_LO = 0xFF_FFFF
 
+# The maximum value of counter_hi and counter_lo fields combined.
+MAX_COUNTER = (MAX_COUNTER_HI << 24) | MAX_COUNTER_LO
+
 # Digit characters used in the Base36 notation.
 DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
 
+# All two-digit combinations of DIGITS, indexed by their values (0 to 36 ** 2 - 1).
+DIGIT_PAIRS = tuple(hi + lo for hi in DIGITS for lo in DIGITS)
+
+# The number of random bytes fetched at once by the default random number generator.
+RANDOM_BUFFER_SIZE = 4_096
+
 # The default timestamp rollback allowance.
 DEFAULT_ROLLBACK_ALLOWANCE = 10_000  # 10 seconds
 
@@ -37,34 +46,44 @@ class Scru128Id:
     Represents a SCRU128 ID and provides converters and comparison operators.
     """
 
-    __slots__ = "_value"
+    __slots__ = ("_value", "_str")
 
     def __init__(self, int_value: int) -> None:
         """Creates an object from a 128-bit unsigned integer."""
         self._value = int_value
+        self._str: typing.Optional[str] = None
         if not (0 <= int_value <= 0xFFFF_FFFF_FFFF_FFFF_FFFF_FFFF_FFFF_FFFF):
             raise ValueError("not a 128-bit unsigned integer")
 
+    @classmethod
+    def _from_raw(cls, int_value: int) -> Scru128Id:
+        """Creates an object from a 128-bit unsigned integer without validation."""
+        obj = object.__new__(cls)
+        obj._value = int_value
+        obj._str = None
+        return obj
+
     @classmethod
     def from_fields(
         cls, timestamp: int, counter_hi: int, counter_lo: int, entropy: int
     ) -> Scru128Id:
         """Creates an object from field values."""
-        if not (
-            0 <= timestamp <= MAX_TIMESTAMP
-            and 0 <= counter_hi <= MAX_COUNTER_HI
-            and 0 <= counter_lo <= MAX_COUNTER_LO
-            and 0 <= entropy <= 0xFFFF_FFFF
-        ):
+        # shifting out the valid bits leaves zero only for in-range values; negative
+        # values shift to -1
+        if timestamp >> 48 or counter_hi >> 24 or counter_lo >> 24 or entropy >> 32:
             raise ValueError("invalid field value")
-        return cls(
-            (timestamp << 80) | (counter_hi << 56) | (counter_lo << 32) | entropy
+        # shift in one field at a time to keep the intermediate values small
+        return cls._from_raw(
+            (((((timestamp << 24) | counter_hi) << 24) | counter_lo) << 32) | entropy
         )
 
     @classmethod
     def from_str(cls, str_value: str) -> Scru128Id:
         """Creates an object from a 25-digit string representation."""
-        if re.match(r"^[0-9A-Za-z]{25}$", str_value) is None:
+        if not isinstance(str_value, str):
+            # reject bytes, which would otherwise pass the checks below and int()
+            raise TypeError("string representation must be a str")
+        if not (len(str_value) == 25 and str_value.isascii() and str_value.isalnum()):
             raise ValueError("invalid string representation")
         return cls(int(str_value, 36))
 
@@ -75,7 +94,7 @@ class Scru128Id:
     @property
     def timestamp(self) -> int:
         """Returns the 48-bit timestamp field value."""
-        return (self._value >> 80) & MAX_TIMESTAMP
+        return self._value >> 80
 
     @property
     def counter_hi(self) -> int:
@@ -94,16 +113,38 @@ class Scru128Id:
 
     def __str__(self) -> str:
         """Returns the 25-digit canonical string representation."""
-        buffer = ["0"] * 25
+        if self._str is not None:
+            return self._str
+
+        buffer = ["0"] * 13
         n = self._value
-        for i in range(25):
-            (n, rem) = divmod(n, 36)
-            buffer[24 - i] = DIGITS[rem]
-        return "".join(buffer)
+        for i in range(12, 0, -1):
+            (n, rem) = divmod(n, 1_296)
+            buffer[i] = DIGIT_PAIRS[rem]
+        buffer[0] = DIGITS[n]
+        self._str = "".join(buffer)
+        return self._str
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(0x{self._value:032X})"
 
+    def __reduce__(self) -> tuple[type[Scru128Id], tuple[int]]:
+        # leave the cached string representation out of pickles
+        return (self.__class__, (self._value,))
+
+    def __setstate__(self, state: tuple[None, dict[str, int]]) -> None:
+        # accept the slot state of pickles created before the string cache was added
+        self._value = state[1]["_value"]
+        self._str = None
+
+    def __copy__(self) -> Scru128Id:
+        obj = self._from_raw(self._value)
+        obj._str = self._str
+        return obj
+
+    def __deepcopy__(self, memo: dict[int, object]) -> Scru128Id:
+        return self.__copy__()
+
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, self.__class__):
             return NotImplemented
@@ -134,8 +175,49 @@ class Scru128Id:
 
 
 class DefaultRandom:
+    """
+    Serves random bits from a buffer of random bytes refilled by `os.urandom()` in
+    bulk, so that generating an ID does not call into the OS every time.
+
+    Unlike `secrets.randbits()`, an instance is not thread-safe: concurrent calls
+    may be served the same bytes. Each Scru128Generator creates its own instance
+    and calls it under its lock; do not share one instance across threads.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = b""
+        self._pos = 0
+        _default_randoms.add(self)
+
     def getrandbits(self, k: int) -> int:
-        return secrets.randbits(k)
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        n = (k + 7) >> 3
+        pos = self._pos
+        end = pos + n
+        if end > len(self._buffer):
+            self._buffer = os.urandom(max(n, RANDOM_BUFFER_SIZE))
+            pos, end = 0, n
+        self._pos = end
+        return int.from_bytes(self._buffer[pos:end], "big") >> ((n << 3) - k)
+
+    def _discard(self) -> None:
+        self._buffer = b""
+        self._pos = 0
+
+
+# DefaultRandom instances to be cleared in a forked child so that it does not repeat
+# the random bytes buffered by the parent.
+_default_randoms: weakref.WeakSet[DefaultRandom] = weakref.WeakSet()
+
+
+def _discard_default_randoms() -> None:
+    for rng in _default_randoms:
+        rng._discard()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_discard_default_randoms)
 
 
 class Scru128Generator:
@@ -165,6 +247,15 @@ class Scru128Generator:
     behavior.
     """
 
+    __slots__ = (
+        "_timestamp",
+        "_counter",
+        "_ts_counter_hi",
+        "_lock",
+        "_getrandbits",
+        "__weakref__",
+    )
+
     def __init__(self, *, rng: typing.Any = None) -> None:
         """
         Creates a generator object with the default random number generator, or with the
@@ -177,16 +268,14 @@ class Scru128Generator:
                  random.Random and random.SystemRandom.
         """
         self._timestamp = 0
-        self._counter_hi = 0
-        self._counter_lo = 0
+        self._counter = 0
         self._ts_counter_hi = 0
         self._lock = threading.Lock()
         if rng is None:
-            self._rng = DefaultRandom()
-        elif callable(getattr(rng, "getrandbits", None)):
-            self._rng = rng
-        else:
+            rng = DefaultRandom()
+        elif not callable(getattr(rng, "getrandbits", None)):
             raise TypeError("rng does not implement getrandbits()")
+        self._getrandbits: typing.Callable[[int], int] = rng.getrandbits
 
     def generate(self) -> Scru128Id:
         """
@@ -196,10 +285,23 @@ class Scru128Generator:
         See the Scru128Generator class documentation for the description.
         """
         with self._lock:
-            timestamp = datetime.datetime.now().timestamp()
-            return self.generate_or_reset_core(
-                int(timestamp * 1_000), DEFAULT_ROLLBACK_ALLOWANCE
-            )
+            timestamp = time.time_ns() // 1_000_000
+            return self.generate_or_reset_core(timestamp, DEFAULT_ROLLBACK_ALLOWANCE)
+
+    def generate_batch(self, n: int) -> list[Scru128Id]:
+        """
+        Generates `n` new SCRU128 ID objects at once from the current `timestamp`, or
+        resets the generator upon significant timestamp rollback.
+
+        This method is equivalent to calling `generate()` `n` times but acquires the
+        internal lock only once for the entire batch.
+        """
+        clock = time.time_ns
+        core = self.generate_or_reset_core
+        with self._lock:
+            return [
+                core(clock() // 1_000_000, DEFAULT_ROLLBACK_ALLOWANCE) for _ in range(n)
+            ]
 
     def generate_or_abort(self) -> typing.Optional[Scru128Id]:
         """
@@ -209,10 +311,8 @@ class Scru128Generator:
         See the Scru128Generator class documentation for the description.
         """
         with self._lock:
-            timestamp = datetime.datetime.now().timestamp()
-            return self.generate_or_abort_core(
-                int(timestamp * 1_000), DEFAULT_ROLLBACK_ALLOWANCE
-            )
+            timestamp = time.time_ns() // 1_000_000
+            return self.generate_or_abort_core(timestamp, DEFAULT_ROLLBACK_ALLOWANCE)
 
     def generate_or_reset_core(
         self, timestamp: int, rollback_allowance: int
@@ -260,33 +360,34 @@ class Scru128Generator:
         elif not (0 <= rollback_allowance <= MAX_TIMESTAMP):
             raise ValueError("`rollback_allowance` out of reasonable range")
 
+        # counter_hi and counter_lo are kept together in the 48-bit _counter so that
+        # incrementing them takes a single addition and overflow check
         if timestamp > self._timestamp:
+            # draw counter_lo and entropy at once
+            rand = self._getrandbits(56)
             self._timestamp = timestamp
-            self._counter_lo = self._rng.getrandbits(24)
+            self._counter = ((self._counter >> 24) << 24) | (rand >> 32)
         elif timestamp + rollback_allowance >= self._timestamp:
             # go on with previous timestamp if new one is not much smaller
-            self._counter_lo += 1
-            if self._counter_lo > MAX_COUNTER_LO:
-                self._counter_lo = 0
-                self._counter_hi += 1
-                if self._counter_hi > MAX_COUNTER_HI:
-                    self._counter_hi = 0
-                    # increment timestamp at counter overflow
-                    self._timestamp += 1
-                    self._counter_lo = self._rng.getrandbits(24)
+            rand = self._getrandbits(32)
+            self._counter += 1
+            if self._counter > MAX_COUNTER:
+                # increment timestamp at counter overflow
+                self._timestamp += 1
+                self._counter = self._getrandbits(24)
         else:
             # abort if clock went backwards to unbearable extent
             return None
 
         if self._timestamp - self._ts_counter_hi >= 1_000 or self._ts_counter_hi < 1:
             self._ts_counter_hi = self._timestamp
-            self._counter_hi = self._rng.getrandbits(24)
+            self._counter = (self._getrandbits(24) << 24) | (
+                self._counter & MAX_COUNTER_LO
+            )
 
-        return Scru128Id.from_fields(
-            self._timestamp,
-            self._counter_hi,
-            self._counter_lo,
-            self._rng.getrandbits(32),
+        # fields are in range by construction
+        return Scru128Id._from_raw(
+            (((self._timestamp << 48) | self._counter) << 32) | (rand & 0xFFFF_FFFF)
         )
 
     def __iter__(self) -> typing.Iterator[Scru128Id]:
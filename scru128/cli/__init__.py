@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import datetime
+import functools
 import sys
 
 from .. import new, Scru128Id
@@ -38,12 +39,14 @@ def inspect() -> None:
     )
 
     args = parser.parse_args()
+    write = sys.stdout.write
     try:
         for line in args.file:
             line = line.strip()
             if line != "":
                 try:
-                    print(_inspect_id(line))
+                    # one write per object instead of print()'s separate newline write
+                    write(_inspect_id(line) + "\n")
                 except ValueError:
                     print("warning: skipped invalid identifier:", line, file=sys.stderr)
     except KeyboardInterrupt:
@@ -52,24 +55,35 @@ def inspect() -> None:
 
 def _inspect_id(src: str) -> str:
     obj = Scru128Id.from_str(src)
-    timestamp_iso = datetime.datetime.fromtimestamp(
-        obj.timestamp / 1000, tz=datetime.timezone.utc
-    ).isoformat(timespec="milliseconds")
-    fields_hex = '["{:012x}", "{:06x}", "{:06x}", "{:08x}"]'.format(
-        obj.timestamp, obj.counter_hi, obj.counter_lo, obj.entropy
+    (seconds, millis) = divmod(obj.timestamp, 1000)
+    timestamp_iso = f"{_iso_seconds(seconds)}.{millis:03}+00:00"
+    fields_hex = '["%012x", "%06x", "%06x", "%08x"]' % (
+        obj.timestamp,
+        obj.counter_hi,
+        obj.counter_lo,
+        obj.entropy,
     )
 
-    return "\n".join(
-        (
-            "{",
-            f'  "input":        "{src}",',
-            f'  "canonical":    "{obj}",',
-            f'  "timestampIso": "{timestamp_iso}",',
-            f'  "timestamp":    "{obj.timestamp}",',
-            f'  "counterHi":    "{obj.counter_hi}",',
-            f'  "counterLo":    "{obj.counter_lo}",',
-            f'  "entropy":      "{obj.entropy}",',
-            f'  "fieldsHex":    {fields_hex}',
-            "}",
-        )
+    # adjacent literals compile to a single string build without a temporary tuple
+    return (
+        "{\n"
+        f'  "input":        "{src}",\n'
+        f'  "canonical":    "{obj}",\n'
+        f'  "timestampIso": "{timestamp_iso}",\n'
+        f'  "timestamp":    "{obj.timestamp}",\n'
+        f'  "counterHi":    "{obj.counter_hi}",\n'
+        f'  "counterLo":    "{obj.counter_lo}",\n'
+        f'  "entropy":      "{obj.entropy}",\n'
+        f'  "fieldsHex":    {fields_hex}\n'
+        "}"
     )
+
+
+@functools.lru_cache(maxsize=1_024)
+def _iso_seconds(seconds: int) -> str:
+    """
+    Returns the ISO 8601 UTC date and time, without the offset, of a Unix time in
+    seconds. Cached because consecutive identifiers mostly share the same second.
+    """
+    dt = datetime.datetime.fromtimestamp(seconds, tz=datetime.timezone.utc)
+    return dt.isoformat(timespec="seconds")[:-6]
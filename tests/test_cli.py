@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import unittest
+
+from scru128.cli import _inspect_id
+
+
+class TestInspect(unittest.TestCase):
+    def test_inspect_id(self) -> None:
+        """Prints the components of an ID with the exact millisecond timestamp"""
+        self.assertEqual(
+            _inspect_id("DN6YW25NB3CQVLWCL7EGZCSUB"),
+            "{\n"
+            '  "input":        "DN6YW25NB3CQVLWCL7EGZCSUB",\n'
+            '  "canonical":    "dn6yw25nb3cqvlwcl7egzcsub",\n'
+            '  "timestampIso": "9999-12-31T23:59:59.999+00:00",\n'
+            '  "timestamp":    "253402300799999",\n'
+            '  "counterHi":    "1",\n'
+            '  "counterLo":    "2",\n'
+            '  "entropy":      "3",\n'
+            '  "fieldsHex":    ["e677d21fdbff", "000001", "000002", "00000003"]\n'
+            "}",
+        )
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import os
+import threading
+import time
+import typing
 import unittest
+import weakref
+from unittest import mock
 
-from scru128 import Scru128Generator, Scru128Id
+from scru128 import RANDOM_BUFFER_SIZE, DefaultRandom, Scru128Generator, Scru128Id
 
 
 class TestGenerateOrReset(unittest.TestCase):
@@ -11,14 +17,14 @@ class TestGenerateOrReset(unittest.TestCase):
         ts = 0x0123_4567_89AB
         g = Scru128Generator()
 
-        prev = g.generate_or_reset_core(ts, 10_000)
-        self.assertEqual(prev.timestamp, ts)
+        ids = [g.generate_or_reset_core(ts, 10_000)]
+        self.assertEqual(ids[0].timestamp, ts)
 
-        for i in range(100_000):
-            curr = g.generate_or_reset_core(ts - min(9_999, i), 10_000)
-            self.assertLess(prev, curr)
-            prev = curr
-        self.assertGreaterEqual(prev.timestamp, ts)
+        ids.extend(
+            g.generate_or_reset_core(ts - min(9_999, i), 10_000) for i in range(100_000)
+        )
+        self.assertTrue(all(prev < curr for prev, curr in zip(ids, ids[1:])))
+        self.assertGreaterEqual(ids[-1].timestamp, ts)
 
     def test_timestamp_rollback(self) -> None:
         """Breaks increasing order of IDs if timestamp goes backwards a lot"""
@@ -47,16 +53,17 @@ class TestGenerateOrAbort(unittest.TestCase):
         ts = 0x0123_4567_89AB
         g = Scru128Generator()
 
-        prev = g.generate_or_abort_core(ts, 10_000)
-        assert prev is not None
-        self.assertEqual(prev.timestamp, ts)
+        first = g.generate_or_abort_core(ts, 10_000)
+        assert first is not None
+        self.assertEqual(first.timestamp, ts)
 
+        ids = [first]
         for i in range(100_000):
             curr = g.generate_or_abort_core(ts - min(9_999, i), 10_000)
             assert curr is not None
-            self.assertLess(prev, curr)
-            prev = curr
-        self.assertGreaterEqual(prev.timestamp, ts)
+            ids.append(curr)
+        self.assertTrue(all(prev < curr for prev, curr in zip(ids, ids[1:])))
+        self.assertGreaterEqual(ids[-1].timestamp, ts)
 
     def test_timestamp_rollback(self) -> None:
         """Returns None if timestamp goes backwards a lot"""
@@ -88,3 +95,114 @@ class TestGenerator(unittest.TestCase):
             if i > 100:
                 break
         self.assertEqual(i, 101)
+
+    def test_weakref(self) -> None:
+        """Supports weak references"""
+        g = Scru128Generator()
+        self.assertIs(weakref.ref(g)(), g)
+
+    def test_type_hints(self) -> None:
+        """Resolves the annotations of the public methods at runtime"""
+        for cls in (Scru128Generator, Scru128Id):
+            for name in dir(cls):
+                if not name.startswith("_") or name in ("__init__", "__iter__"):
+                    attr = getattr(cls, name)
+                    if callable(attr):
+                        typing.get_type_hints(attr)
+
+        hints = typing.get_type_hints(Scru128Generator.generate_or_abort)
+        self.assertEqual(hints["return"], typing.Optional[Scru128Id])
+
+    def test_generate_batch(self) -> None:
+        """Generates a batch of increasing IDs"""
+        g = Scru128Generator()
+        prev = g.generate()
+        batch = g.generate_batch(1_000)
+        self.assertEqual(len(batch), 1_000)
+        for curr in batch:
+            self.assertLess(prev, curr)
+            prev = curr
+        self.assertLess(prev, g.generate())
+        self.assertEqual(g.generate_batch(0), [])
+
+    def test_clock_read_under_lock(self) -> None:
+        """Reads the clock after waiting for a long-held lock"""
+        ts = 0x0123_4567_89AB
+        clock = [ts]
+        results: list[Scru128Id | None] = []
+        with mock.patch("time.time_ns", lambda: clock[0] * 1_000_000):
+            g = Scru128Generator()
+            g.generate()
+
+            with g._lock:
+                t = threading.Thread(
+                    target=lambda: results.append(g.generate_or_abort())
+                )
+                t.start()
+                time.sleep(0.1)
+
+                # another holder of the lock advances the generator by more than the
+                # rollback allowance meanwhile
+                clock[0] = ts + 10_500
+                g.generate_or_abort_core(ts + 10_500, 10_000)
+            t.join()
+
+        self.assertEqual(len(results), 1)
+        self.assertIsNotNone(results[0])
+
+
+class TestDefaultRandom(unittest.TestCase):
+    def test_bit_widths(self) -> None:
+        """Returns k-bit unsigned integers that use the full width"""
+        rng = DefaultRandom()
+        for k in (0, 1, 7, 9, 24, 32, 56, 128):
+            values = [rng.getrandbits(k) for _ in range(200)]
+            self.assertTrue(all(0 <= e < 2**k for e in values), k)
+            if k > 0:
+                self.assertGreaterEqual(max(values), 2 ** (k - 1), k)
+
+    def test_negative_width(self) -> None:
+        """Raises error if a negative number of bits is requested"""
+        with self.assertRaises(ValueError):
+            DefaultRandom().getrandbits(-1)
+
+    def test_buffer_refill(self) -> None:
+        """Refills the buffer when a request crosses its end"""
+        chunks = iter((b"\x01", b"\x02", b"\x03"))
+        with mock.patch("os.urandom", lambda n: next(chunks) * n):
+            rng = DefaultRandom()
+            rest = RANDOM_BUFFER_SIZE - 2
+            self.assertEqual(
+                rng.getrandbits(rest * 8), int.from_bytes(b"\x01" * rest, "big")
+            )
+
+            # 4 bytes requested but only 2 left: served from a fresh buffer
+            self.assertEqual(rng.getrandbits(32), 0x0202_0202)
+
+            # requests larger than the buffer size are served as a whole
+            large = RANDOM_BUFFER_SIZE + 1
+            self.assertEqual(
+                rng.getrandbits(large * 8), int.from_bytes(b"\x03" * large, "big")
+            )
+
+    @unittest.skipUnless(
+        hasattr(os, "fork") and hasattr(os, "register_at_fork"), "requires os.fork()"
+    )
+    def test_fork(self) -> None:
+        """Does not repeat the parent's buffered bytes in a forked child"""
+        rng = DefaultRandom()
+        rng.getrandbits(8)  # fill buffer
+
+        r, w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.write(w, rng.getrandbits(128).to_bytes(16, "big"))
+            finally:
+                os._exit(0)
+
+        os.close(w)
+        with os.fdopen(r, "rb") as f:
+            child = int.from_bytes(f.read(), "big")
+        os.waitpid(pid, 0)
+        self.assertNotEqual(child, rng.getrandbits(128))
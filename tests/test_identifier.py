@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import copy
+import itertools
+import pickle
 import unittest
 
 from scru128 import Scru128Generator, Scru128Id
@@ -11,6 +13,14 @@ MAX_UINT32 = 2**32 - 1
 
 
 class TestIdentifier(unittest.TestCase):
+    _samples: list[Scru128Id]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # converters are deterministic, so a few generated IDs on top of the boundary
+        # cases suffice; bulk generation is stressed in test_scru128
+        cls._samples = list(itertools.islice(Scru128Generator(), 32))
+
     def test_encode_decode(self) -> None:
         """Encodes and decodes prepared cases correctly"""
         cases = [
@@ -34,34 +44,12 @@ class TestIdentifier(unittest.TestCase):
         ]
 
         for e in cases:
-            from_fields = Scru128Id.from_fields(*e[0])
-            from_string = Scru128Id.from_str(e[1])
-            self.assertEqual(int(from_fields), int(e[1], 36))
-            self.assertEqual(int(from_string), int(e[1], 36))
-            self.assertEqual(
-                (
-                    (
-                        from_fields.timestamp,
-                        from_fields.counter_hi,
-                        from_fields.counter_lo,
-                        from_fields.entropy,
-                    ),
-                    str(from_fields),
-                ),
-                (e[0], e[1].lower()),
-            )
-            self.assertEqual(
-                (
-                    (
-                        from_string.timestamp,
-                        from_string.counter_hi,
-                        from_string.counter_lo,
-                        from_string.entropy,
-                    ),
-                    str(from_string),
-                ),
-                (e[0], e[1].lower()),
-            )
+            expected_int = int(e[1], 36)
+            expected = (e[0], e[1].lower())
+            for obj in (Scru128Id.from_fields(*e[0]), Scru128Id.from_str(e[1])):
+                fields = (obj.timestamp, obj.counter_hi, obj.counter_lo, obj.entropy)
+                self.assertEqual(int(obj), expected_int)
+                self.assertEqual((fields, str(obj)), expected)
 
     def test_string_validation(self) -> None:
         """Raises error if an invalid string representation is supplied"""
@@ -77,6 +65,8 @@ class TestIdentifier(unittest.TestCase):
             "036z8puq5a7j0t_08p2cdz28v",
             "036z8pu-5a7j0ti08p3ol8ool",
             "036z8puq5a7j0ti08p4j 6cya",
+            "036z8puq5a7j0ti08p4j６6cya",
+            "036z8puq5a7j0ti08p4j6cyaa\n",
             "f5lxx1zz5pnorynqglhzmsp34",
             "zzzzzzzzzzzzzzzzzzzzzzzzz",
             "039o\tvvklfmqlqe7fzllz7c7t",
@@ -88,9 +78,34 @@ class TestIdentifier(unittest.TestCase):
             "039ooa52xp4bv😘sn97642mwl",
         ]
 
+        def accepts(src: str) -> bool:
+            try:
+                Scru128Id.from_str(src)
+            except ValueError:
+                return False
+            return True
+
+        self.assertEqual([e for e in cases if accepts(e)], [])
+
+        with self.assertRaises(TypeError):
+            Scru128Id.from_str(b"036z8puq5a7j0ti08p4j6cyaa")  # type: ignore[arg-type]
+
+    def test_field_validation(self) -> None:
+        """Raises error if an invalid field value is supplied"""
+        cases = [
+            (-1, 0, 0, 0),
+            (0, -1, 0, 0),
+            (0, 0, -1, 0),
+            (0, 0, 0, -1),
+            (MAX_UINT48 + 1, 0, 0, 0),
+            (0, MAX_UINT24 + 1, 0, 0),
+            (0, 0, MAX_UINT24 + 1, 0),
+            (0, 0, 0, MAX_UINT32 + 1),
+        ]
+
         for e in cases:
             with self.assertRaises(ValueError):
-                Scru128Id.from_str(e)
+                Scru128Id.from_fields(*e)
 
     def test_symmetric_converters(self) -> None:
         """Has symmetric converters from/to various values"""
@@ -103,19 +118,15 @@ class TestIdentifier(unittest.TestCase):
             Scru128Id.from_fields(MAX_UINT48, MAX_UINT24, MAX_UINT24, MAX_UINT32),
         ]
 
-        g = Scru128Generator()
-        for _ in range(1_000):
-            cases.append(g.generate())
+        cases.extend(self._samples)
 
         for e in cases:
-            self.assertEqual(Scru128Id.from_str(str(e)), e)
-            self.assertEqual(Scru128Id(int(e)), e)
-            self.assertEqual(
-                Scru128Id.from_fields(
-                    e.timestamp, e.counter_hi, e.counter_lo, e.entropy
-                ),
-                e,
-            )
+            str_value = str(e)
+            int_value = int(e)
+            fields = (e.timestamp, e.counter_hi, e.counter_lo, e.entropy)
+            self.assertEqual(int(Scru128Id.from_str(str_value)), int_value)
+            self.assertEqual(int(Scru128Id(int_value)), int_value)
+            self.assertEqual(int(Scru128Id.from_fields(*fields)), int_value)
 
     def test_comparison_operators(self) -> None:
         """Supports comparison operators"""
@@ -131,9 +142,7 @@ class TestIdentifier(unittest.TestCase):
             Scru128Id.from_fields(2, 0, 0, 0),
         ]
 
-        g = Scru128Generator()
-        for _ in range(1_000):
-            ordered.append(g.generate())
+        ordered.extend(self._samples)
 
         prev = ordered.pop(0)
         for curr in ordered:
@@ -145,7 +154,7 @@ class TestIdentifier(unittest.TestCase):
             self.assertLess(prev, curr)
             self.assertLessEqual(prev, curr)
 
-            clone = copy.copy(curr)
+            clone = Scru128Id(int(curr))
             self.assertIsNot(curr, clone)
             self.assertIsNot(clone, curr)
             self.assertEqual(curr, clone)
@@ -157,3 +166,30 @@ class TestIdentifier(unittest.TestCase):
             self.assertLessEqual(clone, curr)
 
             prev = curr
+
+    def test_pickle(self) -> None:
+        """Supports pickle round trip, including pickles from earlier versions"""
+        e = Scru128Id.from_str("036z951mhjikzik2gsl81gr7l")
+        str(e)  # populate cache
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            loaded = pickle.loads(pickle.dumps(e, protocol))
+            self.assertEqual(loaded, e)
+            self.assertEqual(str(loaded), str(e))
+
+        # Scru128Id.from_str("036z951mhjikzik2gsl81gr7l") pickled by v3.0.4
+        legacy = (
+            b"\x80\x04\x95>\x00\x00\x00\x00\x00\x00\x00\x8c\x07scru128\x94\x8c\t"
+            b"Scru128Id\x94\x93\x94)\x81\x94N}\x94\x8c\x06_value\x94\x8a\x10\xc1\xfe\r"
+            b"\xf9\x10\xd4\x98w\x08%\xb6\xbe\xd8\xa1\x7f\x01s\x86\x94b."
+        )
+        loaded = pickle.loads(legacy)
+        self.assertEqual(loaded, e)
+        self.assertEqual(str(loaded), str(e))
+
+    def test_copy(self) -> None:
+        """Supports copy protocol"""
+        e = Scru128Generator().generate()
+        for clone in (copy.copy(e), copy.deepcopy(e)):
+            self.assertIsNot(clone, e)
+            self.assertEqual(clone, e)
+            self.assertEqual(str(clone), str(e))
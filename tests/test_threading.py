@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import queue
 import threading
 import unittest
 
@@ -11,17 +10,17 @@ class TestThreading(unittest.TestCase):
     def test_threading(self) -> None:
         """Generates no IDs sharing same timestamp and counters under multithreading"""
 
-        def producer(q: queue.Queue[scru128.Scru128Id]) -> None:
+        def producer(out: list[scru128.Scru128Id]) -> None:
             for i in range(10000):
-                q.put(scru128.new())
+                out.append(scru128.new())
 
-        q: queue.Queue[scru128.Scru128Id] = queue.Queue()
-        for i in range(4):
-            threading.Thread(target=producer, args=(q,)).start()
+        results: list[list[scru128.Scru128Id]] = [[] for _ in range(4)]
+        threads = [threading.Thread(target=producer, args=(e,)) for e in results]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
 
-        s = set()
-        while not (q.empty() and threading.active_count() < 2):
-            e = q.get()
-            s.add((e.timestamp, e.counter_hi, e.counter_lo))
+        s = {(e.timestamp, e.counter_hi, e.counter_lo) for out in results for e in out}
 
         self.assertEqual(len(s), 4 * 10000)